@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+Asynchronous variant of the MWS base class, for issuing many requests concurrently.
+
+Requires the optional `httpx` dependency: `pip install mws[async]`.
+"""
+import asyncio
+
+from mws.mws import MWS, MWSError, clean_params
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class AsyncMWS(MWS):
+    """
+    MWS base class whose `make_request` is a coroutine, sending requests through
+    a shared `httpx.AsyncClient` (HTTP/2 where the server supports it).
+
+    Combine with any API class to get its asynchronous version, like so:
+
+        class AsyncOrders(AsyncMWS, Orders):
+            pass
+
+        async with AsyncOrders(access_key, secret_key, account_id) as api:
+            responses = await api.gather_requests([
+                {"extra_data": {"Action": "GetOrder", "AmazonOrderId.Id.1": order_id}}
+                for order_id in order_ids
+            ])
+
+    Request signing and parsing are shared with MWS: only the transport differs.
+    """
+
+    # Maximum number of connections the client opens at once.
+    MAX_CONNECTIONS = 20
+
+    def __init__(self, *args, **kwargs):
+        if httpx is None:
+            raise MWSError(
+                "AsyncMWS requires httpx. Install it with `pip install mws[async]`."
+            )
+        super(AsyncMWS, self).__init__(*args, **kwargs)
+        self.client = httpx.AsyncClient(**self._client_kwargs())
+
+    def _client_kwargs(self):
+        """
+        Keyword arguments for the `httpx.AsyncClient`, with the same proxy settings as MWS.
+        """
+        limits = httpx.Limits(max_connections=self.MAX_CONNECTIONS)
+        if not self.proxy:
+            # Like MWS, ignore proxies configured through environment variables.
+            return {"http2": True, "limits": limits, "trust_env": False}
+        return {
+            "http2": True,
+            "limits": limits,
+            "mounts": {
+                "{}://".format(scheme): httpx.AsyncHTTPTransport(
+                    proxy=proxy_url, http2=True, limits=limits
+                )
+                for scheme, proxy_url in self.get_proxies().items()
+            },
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def make_request(self, extra_data, method="GET", **kwargs):
+        """
+        Make request to Amazon MWS API with these parameters, without blocking the event loop.
+
+        Streamed responses (`stream=True`) are not supported: the body is always read in full.
+        """
+        if kwargs.get("stream", False):
+            raise MWSError("AsyncMWS does not support stream=True.")
+        params = self.get_default_params()
+        params.update(extra_data)
+
+        if self._test_request_params:
+            # Testing method: return the params from this request before the request is made.
+            return clean_params(params)
+
+        url, headers, body = self._prepare_request(params, method, **kwargs)
+
+        try:
+            response = await self.client.request(
+                method,
+                url,
+                content=body,
+                headers=headers,
+                timeout=kwargs.get("timeout", 300),
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            error = MWSError(str(exc.response.text))
+            error.response = exc.response
+            raise error
+
+        return self._parse_response(response, extra_data, **kwargs)
+
+    async def gather_requests(self, request_specs):
+        """
+        Runs several requests concurrently, returning their responses in the same order.
+
+        Each item of `request_specs` is a dict of keyword arguments for `make_request`,
+        like `{"extra_data": {"Action": "GetServiceStatus"}, "method": "GET"}`.
+        """
+        return await asyncio.gather(
+            *[self.make_request(**spec) for spec in request_specs]
+        )
+
+    async def aclose(self):
+        """
+        Closes the underlying HTTP clients, releasing any pooled connections.
+        """
+        await self.client.aclose()
+        self.close()
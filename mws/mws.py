@@ -10,21 +10,39 @@ import warnings
 from zipfile import ZipFile
 from io import BytesIO
 
-from requests import request
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 from requests.exceptions import HTTPError
 from enum import Enum
 
 from mws import utils
 
-try:
-    from urllib.parse import quote
-except ImportError:
-    from urllib import quote
 from xml.etree.ElementTree import ParseError as XMLError
 
 
 __version__ = "1.0.0dev11"
 
+# Values made up only of these characters need no escaping at all.
+SAFE_PARAM_VALUE_REGEX = re.compile(r"[A-Za-z0-9\-_.~]+")
+
+# Escaped form of every byte value: unreserved characters map to themselves,
+# everything else to its "%XX" form.
+PERCENT_ENCODE_TABLE = [
+    chr(byte)
+    if SAFE_PARAM_VALUE_REGEX.fullmatch(chr(byte))
+    else "%{:02X}".format(byte)
+    for byte in range(256)
+]
+
+# Namespace declarations and prefixes removed by `remove_namespace`.
+NAMESPACE_REGEX = re.compile(' xmlns(:ns2)?="[^"]+"|(ns2:)|(xml:)')
+
+# Captures the namespaces `remove_namespace` strips: default and "ns2" declarations.
+STRIPPED_NAMESPACE_REGEX = re.compile(' xmlns(?::ns2)?="([^"]+)"')
+
+# Namespace of the reserved "xml:" prefix, which `remove_namespace` strips too.
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
 
 class Marketplaces(Enum):
     """
@@ -57,6 +75,13 @@ class Marketplaces(Enum):
         self.marketplace_id = marketplace_id
 
 
+# Endpoint for each region name, aliases (like UK) included.
+REGION_ENDPOINTS = {
+    name: marketplace.endpoint
+    for name, marketplace in Marketplaces.__members__.items()
+}
+
+
 class MWSError(Exception):
     """
     Main MWS Exception class
@@ -84,20 +109,17 @@ def calc_request_description(params):
     Returns:
       "bar=4&baz=potato&foo=1"
     """
-    description_items = []
-    for item in sorted(params.keys()):
-        encoded_val = params[item]
-        description_items.append("{}={}".format(item, encoded_val))
-    return "&".join(description_items)
+    return "&".join(
+        ["{}={}".format(key, value) for key, value in sorted(params.items())]
+    )
 
 
-def clean_params(params):
-    """Input cleanup and prevent a lot of common input mistakes."""
-    # silently remove parameter where values are empty
-    params = {k: v for k, v in params.items() if v is not None and v != ""}
-
-    params_enc = dict()
-    for key, value in params.items():
+def clean_param_value(key, value):
+    """
+    Converts a single param value to its string form, escaped with `percent_encode`.
+    """
+    # Nearly every value is already a plain str: skip the type checks for those.
+    if type(value) is not str:
         if isinstance(value, (dict, list, set, tuple)):
             message = (
                 "expected string or datetime datatype, got {},"
@@ -110,8 +132,54 @@ def clean_params(params):
             value = str(value).lower()
         value = str(value)
 
-        params_enc[key] = quote(value, safe="-_.~")
-    return params_enc
+    if SAFE_PARAM_VALUE_REGEX.fullmatch(value):
+        # Typical IDs, SKUs and enums: skip escaping altogether
+        return value
+    return percent_encode(value)
+
+
+def percent_encode(value):
+    """
+    Escapes a string the same way as `quote(value, safe="-_.~")`,
+    using a lookup table for each UTF-8 byte instead of urllib's generic quoter.
+    """
+    return "".join([PERCENT_ENCODE_TABLE[byte] for byte in value.encode("utf-8")])
+
+
+def clean_params(params):
+    """Input cleanup and prevent a lot of common input mistakes."""
+    # silently remove parameter where values are empty
+    return {
+        key: clean_param_value(key, value)
+        for key, value in params.items()
+        if value is not None and value != ""
+    }
+
+
+def build_request_description(params):
+    """
+    Cleans the params dict and builds the request description from it in a single pass.
+
+    Equivalent to `calc_request_description(clean_params(params))`,
+    without building the intermediate dict of cleaned params.
+    Keys are used as-is: only values are escaped.
+    """
+    # This runs for every param of every request: plain str values that need
+    # no escaping are used directly, saving a function call for each of them.
+    safe_match = SAFE_PARAM_VALUE_REGEX.fullmatch
+    return "&".join(
+        [
+            key
+            + "="
+            + (
+                value
+                if type(value) is str and safe_match(value)
+                else clean_param_value(key, value)
+            )
+            for key, value in sorted(params.items())
+            if value is not None and value != ""
+        ]
+    )
 
 
 def remove_namespace(xml):
@@ -119,21 +187,35 @@ def remove_namespace(xml):
     Strips the namespace from XML document contained in a string.
     Returns the stripped string.
     """
-    regex = re.compile(' xmlns(:ns2)?="[^"]+"|(ns2:)|(xml:)')
-    return regex.sub("", xml)
+    return NAMESPACE_REGEX.sub("", xml)
+
+
+def stripped_namespaces(xml):
+    """
+    Returns the set of namespace URIs that `remove_namespace` would strip from
+    the XML document contained in a string, to be dropped while parsing instead.
+    Any other namespace is kept, as it would be by `remove_namespace`.
+    """
+    namespaces = set(STRIPPED_NAMESPACE_REGEX.findall(xml))
+    namespaces.add(XML_NAMESPACE)
+    return namespaces
 
 
 class DictWrapper(object):
     """
     Main class that converts XML data to a parsed response object as a tree of ObjectDicts,
     stored in the .parsed property.
+
+    With `raw=True`, the tree is built from plain dicts instead.
+    Consumers of large responses (like Reports and Feeds results) should opt in to this,
+    together with `record_tag` where the response is a long list of records.
     """
 
     # TODO create a base class for DictWrapper and DataWrapper with all the keys we expect in responses.
     # This will make it easier to use either class in place of each other.
     # Either this, or pile everything into DataWrapper and make it able to handle all cases.
 
-    def __init__(self, xml, rootkey=None):
+    def __init__(self, xml, rootkey=None, record_tag=None, raw=False):
         if isinstance(xml, bytes):
             try:
                 xml = xml.decode(encoding="iso-8859-1")
@@ -145,7 +227,21 @@ class DictWrapper(object):
 
         self.response = None
         self._rootkey = rootkey
-        self._mydict = utils.XML2Dict().fromstring(remove_namespace(xml))
+        self._record_tag = record_tag
+        self._record_parser = None
+        # Plain dicts are cheaper to build, for callers that don't need attribute access.
+        self._dict_class = dict if raw else utils.ObjectDict
+        if record_tag:
+            # Parsed lazily, one record at a time, by the `parsed` property.
+            # Data that isn't XML must still raise here, so callers can fall back to DataWrapper.
+            utils.XML2Dict().check_start(xml)
+            self._xml = xml
+            return
+        # Namespaces are stripped by the parser itself, rather than rewriting
+        # a copy of the whole document before parsing.
+        self._mydict = utils.XML2Dict(
+            strip_namespaces=stripped_namespaces(xml), dict_class=self._dict_class
+        ).fromstring(xml)
         self._response_dict = self._mydict.get(
             list(self._mydict.keys())[0], self._mydict
         )
@@ -153,11 +249,43 @@ class DictWrapper(object):
     @property
     def parsed(self):
         """
-        Provides access to the parsed contents of an XML response as a tree of ObjectDicts.
+        Provides access to the parsed contents of an XML response as a tree of ObjectDicts,
+        or of plain dicts if `raw` was set.
+
+        If a `record_tag` was given, returns an iterator of ObjectDicts (plain dicts with `raw`)
+        instead, one for each element with that tag, parsed incrementally.
+        Everything else in the response, like pagination tokens (NextToken, HasNext),
+        is left out of the records: see `remainder`.
+        """
+        if self._record_tag:
+            self._record_parser = utils.XML2Dict(
+                strip_namespaces=stripped_namespaces(self._xml),
+                dict_class=self._dict_class,
+            )
+            return self._record_parser.iterrecords(self._xml, self._record_tag)
+        return self._get_result(self._response_dict)
+
+    @property
+    def remainder(self):
+        """
+        When a `record_tag` was given: once all records from `parsed` have been iterated,
+        provides the rest of the response (like NextToken and HasNext for paginated calls),
+        in the same shape as `parsed` has without a `record_tag`.
+
+        None until the records have been iterated in full.
+        """
+        if self._record_parser is None or self._record_parser.remainder is None:
+            return None
+        remainder = self._record_parser.remainder
+        return self._get_result(remainder.get(list(remainder.keys())[0], remainder))
+
+    def _get_result(self, response_dict):
+        """
+        Returns the node under the root key from the response dict, if present.
         """
         if self._rootkey:
-            return self._response_dict.get(self._rootkey, self._response_dict)
-        return self._response_dict
+            return response_dict.get(self._rootkey, response_dict)
+        return response_dict
 
 
 class DataWrapper(object):
@@ -169,17 +297,50 @@ class DataWrapper(object):
         self.original = data
         self.response = None
         self.headers = headers
+        # `data` is None for streamed responses: their hash is validated by `iter_content`.
+        if data is not None:
+            self.validate_hash(utils.calc_md5(self.original))
+
+    def validate_hash(self, hash_):
+        """
+        Compares a base64-encoded MD5 hash of the content to the one sent by Amazon, if any.
+        """
         if "content-md5" in self.headers:
-            hash_ = utils.calc_md5(self.original)
             if self.headers["content-md5"].encode() != hash_:
                 raise MWSError("Wrong Content length, maybe amazon error...")
 
+    def _check_not_streamed(self):
+        """
+        Raises MWSError if the body was left unread, for a response requested with `stream=True`.
+        """
+        if self.original is None:
+            raise MWSError(
+                "The response body was requested with stream=True: "
+                "read it with iter_content() instead."
+            )
+
+    def iter_content(self, chunk_size=65536):
+        """
+        For responses requested with `stream=True`, yields the response body in chunks,
+        validating its hash once the body is exhausted.
+
+        Large reports can be written out this way without holding the whole payload in memory.
+        """
+        md5_hash = hashlib.md5()
+        for chunk in self.response.iter_content(chunk_size):
+            md5_hash.update(chunk)
+            yield chunk
+        self.validate_hash(base64.b64encode(md5_hash.digest()))
+
     @property
     def parsed(self):
         """
         Similar to the `parsed` property of DictWrapper, this provides a similar interface for a data response
         that could not be parsed as XML.
+
+        Not available for responses requested with `stream=True`: use `iter_content` for those.
         """
+        self._check_not_streamed()
         return self.original
 
     """
@@ -190,16 +351,16 @@ class DataWrapper(object):
     def unzipped(self):
         """
         If the response is comprised of a zip file, returns a ZipFile object of those file contents.
+        Members are read in memory with `ZipFile.open` or `ZipFile.read`: nothing is written to disk.
 
         Otherwise, returns None.
+
+        Not available for responses requested with `stream=True`: use `iter_content` for those.
         """
+        self._check_not_streamed()
         if self.headers["content-type"] == "application/zip":
             try:
-                with ZipFile(BytesIO(self.original)) as unzipped_fileobj:
-                    # unzipped the zip file contents
-                    unzipped_fileobj.extractall()
-                    # return original zip file object to the user
-                    return unzipped_fileobj
+                return ZipFile(BytesIO(self.original))
             except Exception as exc:
                 raise MWSError(str(exc))
         return None  # 'The response is not a zipped file.'
@@ -263,12 +424,40 @@ class MWS(object):
         self.uri = uri or self.URI
         self.proxy = proxy
 
+        # Keyed HMAC state, copied for each signature so the key's inner and
+        # outer pads are not re-derived on every request.
+        # This measures faster than the one-shot `hmac.digest` (which re-keys on
+        # every call), and works on Python versions older than 3.7 as well.
+        # Built on first use, and rebuilt if `secret_key` changes.
+        self._hmac_key = None
+        self._hmac_template = None
+
+        # Reuse connections (and their TLS sessions) across requests.
+        # Server errors are retried a few times with backoff before giving up;
+        # the final response is still returned, so `raise_for_status` reports it.
+        # Connection errors and timeouts are not retried, and raise as they would without retries.
+        self.session = Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(
+                    total=3,
+                    connect=False,
+                    read=False,
+                    backoff_factor=0.3,
+                    status_forcelist=[500, 502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ),
+        )
+
         # * TESTING FLAGS * #
         self._test_request_params = False
 
-        if region in Marketplaces.__members__:
-            self.domain = Marketplaces[region].endpoint
-        else:
+        self.domain = REGION_ENDPOINTS.get(region)
+        if self.domain is None:
             error_msg = (
                 "Incorrect region supplied: {region}. "
                 "Must be one of the following: {regions}".format(
@@ -277,22 +466,49 @@ class MWS(object):
             )
             raise MWSError(error_msg)
 
+        # Cache of "method\nhost\nuri\n" signature prefixes, keyed by (method, domain, uri):
+        # only the request description varies between signatures.
+        self._sig_prefixes = {}
+
+        # The parameters required in all MWS requests, except the timestamp.
+        # Built on first use, and rebuilt if any of the values they come from change.
+        self._base_params_key = None
+        self._base_params = None
+
+    def __getstate__(self):
+        """
+        Drops the keyed HMAC state when pickling or copying, as it can't be pickled.
+        It is rebuilt on the next signature.
+        """
+        state = self.__dict__.copy()
+        state["_hmac_key"] = None
+        state["_hmac_template"] = None
+        return state
+
     def get_default_params(self):
         """
         Get the parameters required in all MWS requests
         """
-        params = {
-            "AWSAccessKeyId": self.access_key,
-            self.ACCOUNT_TYPE: self.account_id,
-            "SignatureVersion": "2",
-            "Timestamp": utils.get_utc_timestamp(),
-            "Version": self.version,
-            "SignatureMethod": "HmacSHA256",
-        }
-        if self.auth_token:
-            params["MWSAuthToken"] = self.auth_token
-        # TODO current tests only check for auth_token being set.
-        # need a branch test to check for auth_token being skipped (no key present)
+        base_params_key = (
+            self.access_key,
+            self.ACCOUNT_TYPE,
+            self.account_id,
+            self.version,
+            self.auth_token,
+        )
+        if base_params_key != self._base_params_key:
+            self._base_params = {
+                "AWSAccessKeyId": self.access_key,
+                self.ACCOUNT_TYPE: self.account_id,
+                "SignatureVersion": "2",
+                "Version": self.version,
+                "SignatureMethod": "HmacSHA256",
+            }
+            if self.auth_token:
+                self._base_params["MWSAuthToken"] = self.auth_token
+            self._base_params_key = base_params_key
+        params = self._base_params.copy()
+        params["Timestamp"] = utils.get_utc_timestamp()
         return params
 
     def make_request(self, extra_data, method="GET", **kwargs):
@@ -300,69 +516,117 @@ class MWS(object):
         Make request to Amazon MWS API with these parameters
         """
         params = self.get_default_params()
-        proxies = self.get_proxies()
         params.update(extra_data)
-        params = clean_params(params)
 
         if self._test_request_params:
             # Testing method: return the params from this request before the request is made.
-            return params
+            return clean_params(params)
         # TODO: All current testing stops here. More branches needed.
 
-        request_description = calc_request_description(params)
-        signature = self.calc_signature(method, request_description)
-        url = "{domain}{uri}?{description}&Signature={signature}".format(
-            domain=self.domain,
-            uri=self.uri,
-            description=request_description,
-            signature=quote(signature),
-        )
-        headers = {
-            "User-Agent": "python-amazon-mws/{} (Language=Python)".format(__version__)
-        }
-        headers.update(kwargs.get("extra_headers", {}))
+        url, headers, body = self._prepare_request(params, method, **kwargs)
 
         try:
             # Some might wonder as to why i don't pass the params dict as the params argument to request.
             # My answer is, here i have to get the url parsed string of params in order to sign it, so
             # if i pass the params dict as params to request, request will repeat that step because it will need
             # to convert the dict to a url parsed string, so why do it twice if i can just pass the full url :).
-            response = request(
+            response = self.session.request(
                 method,
                 url,
-                data=kwargs.get("body", ""),
+                data=body,
                 headers=headers,
-                proxies=proxies,
+                proxies=self.get_proxies(),
                 timeout=kwargs.get("timeout", 300),
+                stream=kwargs.get("stream", False),
             )
             response.raise_for_status()
-            # When retrieving data from the response object,
-            # be aware that response.content returns the content in bytes while response.text calls
-            # response.content and converts it to unicode.
-
-            data = response.content
-            # I do not check the headers to decide which content structure to server simply because sometimes
-            # Amazon's MWS API returns XML error responses with "text/plain" as the Content-Type.
-            rootkey = kwargs.get("rootkey", extra_data.get("Action") + "Result")
-            try:
-                try:
-                    parsed_response = DictWrapper(data, rootkey)
-                except TypeError:  # raised when using Python 3 and trying to remove_namespace()
-                    # When we got CSV as result, we will got error on this
-                    parsed_response = DictWrapper(response.text, rootkey)
-
-            except XMLError:
-                parsed_response = DataWrapper(data, response.headers)
-
         except HTTPError as exc:
             error = MWSError(str(exc.response.text))
             error.response = exc.response
             raise error
 
+        if kwargs.get("stream", False):
+            # Leave the body unread: the caller consumes it through `DataWrapper.iter_content`.
+            parsed_response = DataWrapper(None, response.headers)
+            parsed_response.response = response
+            return parsed_response
+
+        return self._parse_response(response, extra_data, **kwargs)
+
+    def _prepare_request(self, params, method="GET", **kwargs):
+        """
+        Signs the request params, returning the url, headers and body to send.
+        """
+        request_description = build_request_description(params)
+        signature = self.calc_signature(method, request_description)
+        # Of the base64 alphabet, `quote(signature)` only escapes "+" and "=":
+        # replace those directly rather than going through the generic quoter.
+        signature = signature.replace(b"+", b"%2B").replace(b"=", b"%3D").decode()
+        signed_description = "{description}&Signature={signature}".format(
+            description=request_description, signature=signature,
+        )
+        headers = {
+            "User-Agent": "python-amazon-mws/{} (Language=Python)".format(__version__)
+        }
+        body = kwargs.get("body", "")
+        if method == "POST" and not body:
+            # Send the params as a form-encoded body, rather than growing the url,
+            # unless the body is taken already (like the feed content in SubmitFeed).
+            url = "{domain}{uri}".format(domain=self.domain, uri=self.uri)
+            body = signed_description
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        else:
+            url = "{domain}{uri}?{description}".format(
+                domain=self.domain, uri=self.uri, description=signed_description,
+            )
+        headers.update(kwargs.get("extra_headers", {}))
+        return url, headers, body
+
+    def _parse_response(self, response, extra_data, **kwargs):
+        """
+        Wraps a successful response in a DictWrapper, or a DataWrapper if it is not XML.
+        """
+        # When retrieving data from the response object,
+        # be aware that response.content returns the content in bytes while response.text calls
+        # response.content and converts it to unicode.
+
+        data = response.content
+        content_type = response.headers.get("content-type", "").lower()
+        if content_type and not (
+            "xml" in content_type or content_type.startswith("text/plain")
+        ):
+            # Zip files, PDFs and other binary payloads are never XML:
+            # skip the (failing) parse attempt altogether.
+            parsed_response = DataWrapper(data, response.headers)
+            parsed_response.response = response
+            return parsed_response
+
+        # Plain text is still parsed, simply because sometimes
+        # Amazon's MWS API returns XML error responses with "text/plain" as the Content-Type.
+        rootkey = kwargs.get("rootkey", extra_data.get("Action") + "Result")
+        # When a record tag is given, records are parsed one at a time as they are iterated.
+        record_tag = kwargs.get("record_tag")
+        raw = kwargs.get("raw", False)
+        try:
+            try:
+                parsed_response = DictWrapper(data, rootkey, record_tag, raw)
+            except TypeError:  # raised when using Python 3 and trying to parse the data
+                # When we got CSV as result, we will got error on this
+                parsed_response = DictWrapper(response.text, rootkey, record_tag, raw)
+
+        except XMLError:
+            parsed_response = DataWrapper(data, response.headers)
+
         # Store the response object in the parsed_response for quick access
         parsed_response.response = response
         return parsed_response
 
+    def close(self):
+        """
+        Closes the underlying HTTP session, releasing any pooled connections.
+        """
+        self.session.close()
+
     def get_proxies(self):
         proxies = {"http": None, "https": None}
         if self.proxy:
@@ -413,19 +677,24 @@ class MWS(object):
             method (str)
             request_description (str)
         """
-        sig_data = "\n".join(
-            [
-                method,
-                self.domain.replace("https://", "").lower(),
-                self.uri,
-                request_description,
-            ]
-        )
-        return base64.b64encode(
-            hmac.new(
-                self.secret_key.encode(), sig_data.encode(), hashlib.sha256
-            ).digest()
-        )
+        # Keyed on the current domain and uri, which callers may change after init
+        # (like switching to a sandbox uri).
+        prefix_key = (method, self.domain, self.uri)
+        prefix = self._sig_prefixes.get(prefix_key)
+        if prefix is None:
+            prefix = "{}\n{}\n{}\n".format(
+                method, self.domain.split("://", 1)[-1].lower(), self.uri
+            )
+            self._sig_prefixes[prefix_key] = prefix
+        sig_data = prefix + request_description
+        if self._hmac_key != self.secret_key:
+            self._hmac_template = hmac.new(
+                self.secret_key.encode(), b"", hashlib.sha256
+            )
+            self._hmac_key = self.secret_key
+        mac = self._hmac_template.copy()
+        mac.update(sig_data.encode())
+        return base64.b64encode(mac.digest())
 
     def enumerate_param(self, param, values):
         """
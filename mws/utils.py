@@ -11,6 +11,13 @@ import datetime
 import hashlib
 import xml.etree.ElementTree as ET
 
+# Matches a Clark-notation tag, like '{namespace}tag'
+NAMESPACE_TAG_REGEX = re.compile(r"\{(.*)\}(.*)")
+
+# Matches the start of an XML document, after an optional byte order mark
+# (decoded as UTF-8 or as ISO-8859-1).
+XML_START_REGEX = re.compile("(\ufeff|\xef\xbb\xbf)?\\s*<")
+
 
 class ObjectDict(dict):
     """
@@ -71,24 +78,38 @@ class ObjectDict(dict):
 
 
 class XML2Dict(object):
-    def __init__(self):
-        pass
+    def __init__(self, strip_namespaces=False, dict_class=ObjectDict):
+        """
+        If `strip_namespaces` is True, namespaces are dropped from tags and attributes
+        while parsing, instead of being stored on each node's `namespace` key.
+        It may also be a collection of namespace URIs: only those are dropped,
+        and any other namespace is stored as usual.
+
+        Each node is built as a `dict_class`: pass `dict` to get plain dicts,
+        which are cheaper to build than ObjectDicts when attribute access is not needed.
+        """
+        self.strip_namespaces = strip_namespaces
+        self.dict_class = dict_class
+        # Set by `iterrecords` once all records have been yielded.
+        self.remainder = None
 
     def _parse_node(self, node):
-        node_tree = ObjectDict()
-        # Save attrs and text, hope there will not be a child with same name
+        node_tree = self.dict_class()
+        # Save attrs and text, hope there will not be a child with same name.
+        # Item assignment is used throughout instead of attribute access,
+        # as ObjectDict.__setattr__ adds a Python-level call for every node.
         if node.text:
-            node_tree.value = node.text
+            node_tree["value"] = node.text
         for key, val in node.attrib.items():
-            key, val = self._namespace_split(key, ObjectDict({"value": val}))
+            key, val = self._namespace_split(key, self.dict_class({"value": val}))
             node_tree[key] = val
         # Save childrens
         for child in node:
             tag, tree = self._namespace_split(child.tag, self._parse_node(child))
-            if tag not in node_tree:  # the first time, so store it in dict
+            old = node_tree.get(tag)
+            if old is None:  # the first time, so store it in dict
                 node_tree[tag] = tree
                 continue
-            old = node_tree[tag]
             if not isinstance(old, list):
                 node_tree.pop(tag)
                 node_tree[tag] = [old]  # multi times, so change old dict to a list
@@ -102,9 +123,18 @@ class XML2Dict(object):
         ns = http://cs.sfsu.edu/csc867/myscheduler
         name = patients
         """
-        result = re.compile(r"\{(.*)\}(.*)").search(tag)
+        if not tag.startswith("{"):
+            # Most tags carry no namespace: skip the regex search entirely
+            return (tag, value)
+        if self.strip_namespaces is True:
+            return (tag.rpartition("}")[2], value)
+        if self.strip_namespaces:
+            namespace, _, local_tag = tag[1:].partition("}")
+            if namespace in self.strip_namespaces:
+                return (local_tag, value)
+        result = NAMESPACE_TAG_REGEX.search(tag)
         if result:
-            value.namespace, tag = result.groups()
+            value["namespace"], tag = result.groups()
 
         return (tag, value)
 
@@ -117,11 +147,65 @@ class XML2Dict(object):
 
     def fromstring(self, str_):
         """
-        Convert XML-formatted string to an ObjectDict.
+        Convert XML-formatted string to an ObjectDict,
+        or a plain dict with `dict_class=dict` (as used by DictWrapper's `raw` option).
         """
         text = ET.fromstring(str_)
         root_tag, root_tree = self._namespace_split(text.tag, self._parse_node(text))
-        return ObjectDict({root_tag: root_tree})
+        return self.dict_class({root_tag: root_tree})
+
+    def iterrecords(self, str_, record_tag, chunk_size=65536):
+        """
+        Incrementally parse an XML-formatted string, yielding an ObjectDict
+        for each element whose tag (without namespace) is `record_tag`.
+        With `dict_class=dict` (as used by DictWrapper's `raw` option), plain dicts are yielded instead.
+
+        Each record is discarded from the element tree once yielded, so memory use
+        stays proportional to a single record rather than to the whole document.
+        Records are expected not to be nested inside one another.
+
+        Once all records have been yielded, the rest of the document (like a NextToken)
+        is available in `self.remainder`, in the same shape `fromstring` returns.
+
+        Parse errors are raised as they are reached: a truncated or otherwise
+        malformed document yields the records before the error, then raises ParseError.
+        Use `check_start` to reject data that is not XML at all before iterating.
+        """
+        self.remainder = None
+        parser = ET.XMLPullParser(events=("start", "end"))
+        parents = []
+        root = None
+        for idx in range(0, len(str_), chunk_size):
+            parser.feed(str_[idx : idx + chunk_size])
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    parents.append(elem)
+                    continue
+                parents.pop()
+                if elem.tag.rpartition("}")[2] != record_tag:
+                    continue
+                yield self._parse_node(elem)
+                elem.clear()
+                if parents:
+                    parents[-1].remove(elem)
+        parser.close()
+        if root is not None:
+            # Records were removed from the tree as they were yielded: only the rest is left.
+            root_tag, root_tree = self._namespace_split(root.tag, self._parse_node(root))
+            self.remainder = self.dict_class({root_tag: root_tree})
+
+    def check_start(self, str_, length=1024):
+        """
+        Raises ParseError if the start of an XML-formatted string is not well-formed,
+        without parsing the rest of it.
+        """
+        # The parser may buffer a short input without checking it,
+        # so anything not starting with a tag is rejected up front.
+        if not XML_START_REGEX.match(str_):
+            raise ET.ParseError("syntax error: data does not start with an XML tag")
+        ET.XMLPullParser().feed(str_[:length])
 
 
 def calc_md5(string):
@@ -13,6 +13,7 @@ requires = [
 ]
 extras_require = {
     ":python_version<'3.4'": ["enum34"],
+    "async": ["httpx[http2]"],
 }
 
 # Fix for old setuptools versions.
@@ -1,8 +1,15 @@
 """
 Tests for the mws.MWS class and Marketplaces.
 """
+import base64
+import copy
+import hashlib
+import hmac
+import pickle
+
 import pytest
 from mws import MWS, MWSError, Marketplaces
+from mws.mws import DataWrapper, DictWrapper
 
 mwscred = ["a", "b", "c"]
 
@@ -62,3 +69,141 @@ def test_marketplaces_enum():
     """
     assert Marketplaces.CA.endpoint == "https://mws.amazonservices.ca"
     assert Marketplaces.CA.marketplace_id == "A2EUQ1WTGCTBG2"
+
+
+def test_calc_signature():
+    """Signature is an HMAC-SHA256 of the request, keyed with the secret key."""
+    api = MWS(*mwscred)
+    sig_data = "GET\nmws.amazonservices.com\n/\nAction=GetServiceStatus"
+    expected = base64.b64encode(
+        hmac.new(b"b", sig_data.encode(), hashlib.sha256).digest()
+    )
+    assert api.calc_signature("GET", "Action=GetServiceStatus") == expected
+    # Repeated calls must not share state between signatures
+    assert api.calc_signature("GET", "Action=GetServiceStatus") == expected
+
+
+class StubResponse(object):
+    def __init__(self, content, content_type):
+        self.content = content
+        self.text = content.decode("iso-8859-1")
+        self.headers = {"content-type": content_type}
+
+
+def test_parse_response_by_content_type():
+    api = MWS(*mwscred)
+    xml = b"<GetReportResponse><GetReportResult/></GetReportResponse>"
+    extra_data = {"Action": "GetReport"}
+
+    # XML is parsed, even when Amazon labels it as plain text.
+    for content_type in ("text/xml", "text/plain;charset=Cp1252"):
+        response = api._parse_response(StubResponse(xml, content_type), extra_data)
+        assert isinstance(response, DictWrapper)
+
+    # Binary payloads go straight to DataWrapper, without attempting to parse them.
+    response = api._parse_response(StubResponse(xml, "application/zip"), extra_data)
+    assert isinstance(response, DataWrapper)
+    assert response.parsed == xml
+
+
+def test_get_default_params():
+    api = MWS(*mwscred)
+    params = api.get_default_params()
+    assert params.pop("Timestamp")
+    assert params == {
+        "AWSAccessKeyId": "a",
+        "SellerId": "c",
+        "SignatureVersion": "2",
+        "Version": MWS.VERSION,
+        "SignatureMethod": "HmacSHA256",
+    }
+    # Callers are free to modify the params they get back.
+    params["Action"] = "GetServiceStatus"
+    assert "Action" not in api.get_default_params()
+
+    api = MWS(auth_token="token", *mwscred)
+    assert api.get_default_params()["MWSAuthToken"] == "token"
+
+    # Credentials changed after init are picked up.
+    api = MWS(*mwscred)
+    api.get_default_params()
+    api.auth_token = "new token"
+    api.access_key = "new key"
+    params = api.get_default_params()
+    assert params["MWSAuthToken"] == "new token"
+    assert params["AWSAccessKeyId"] == "new key"
+
+
+def test_prepare_request_post_sends_params_in_body():
+    api = MWS(*mwscred)
+    params = {"Action": "GetReport", "ReportId": "1"}
+
+    url, headers, body = api._prepare_request(params, "GET")
+    assert url.startswith("https://mws.amazonservices.com/?Action=GetReport&ReportId=1")
+    assert "&Signature=" in url
+    assert body == ""
+
+    url, headers, body = api._prepare_request(params, "POST")
+    assert url == "https://mws.amazonservices.com/"
+    assert body.startswith("Action=GetReport&ReportId=1&Signature=")
+    assert headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+    # When the body carries content of its own, params stay in the url.
+    url, headers, body = api._prepare_request(
+        params, "POST", body=b"feed", extra_headers={"Content-Type": "text/xml"}
+    )
+    assert "&Signature=" in url
+    assert body == b"feed"
+    assert headers["Content-Type"] == "text/xml"
+
+
+def test_parse_response_record_tag_falls_back_for_flat_files():
+    """Flat-file reports sent as text/plain still become DataWrappers with a record tag."""
+    api = MWS(*mwscred)
+    report = b"sku\tqty\nabc\t1\n"
+    response = api._parse_response(
+        StubResponse(report, "text/plain;charset=Cp1252"),
+        {"Action": "GetReport"},
+        record_tag="member",
+    )
+    assert isinstance(response, DataWrapper)
+    assert response.parsed == report
+
+
+def test_calc_signature_follows_uri_and_domain_changes():
+    """Changing uri or domain after init is reflected in the signature."""
+    api = MWS(*mwscred)
+    api.calc_signature("GET", "Action=GetServiceStatus")
+    api.uri = "/OffAmazonPayments_Sandbox/2013-01-01/"
+    api.domain = "https://mws-eu.amazonservices.com"
+
+    sig_data = (
+        "GET\nmws-eu.amazonservices.com\n/OffAmazonPayments_Sandbox/2013-01-01/\n"
+        "Action=GetServiceStatus"
+    )
+    expected = base64.b64encode(
+        hmac.new(b"b", sig_data.encode(), hashlib.sha256).digest()
+    )
+    assert api.calc_signature("GET", "Action=GetServiceStatus") == expected
+
+
+def test_calc_signature_follows_secret_key_changes():
+    api = MWS(*mwscred)
+    api.calc_signature("GET", "Action=GetServiceStatus")
+    api.secret_key = "new secret"
+
+    sig_data = "GET\nmws.amazonservices.com\n/\nAction=GetServiceStatus"
+    expected = base64.b64encode(
+        hmac.new(b"new secret", sig_data.encode(), hashlib.sha256).digest()
+    )
+    assert api.calc_signature("GET", "Action=GetServiceStatus") == expected
+
+def test_pickle_after_signing():
+    """Instances that already signed a request can still be pickled and copied."""
+    api = MWS(*mwscred)
+    signature = api.calc_signature("GET", "Action=GetServiceStatus")
+    for api_copy in (pickle.loads(pickle.dumps(api)), copy.deepcopy(api)):
+        assert api_copy.calc_signature("GET", "Action=GetServiceStatus") == signature
+    # The original keeps signing as before.
+    assert api.calc_signature("GET", "Action=GetServiceStatus") == signature
+
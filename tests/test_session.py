@@ -0,0 +1,105 @@
+"""
+Tests for the pooled requests Session used by the MWS class.
+"""
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from mws import MWS, MWSError
+from mws.mws import DictWrapper
+
+STATUS_RESPONSE = b"""<?xml version="1.0"?>
+<GetServiceStatusResponse xmlns="https://mws.amazonservices.com/Orders/2013-09-01">
+<GetServiceStatusResult><Status>GREEN</Status></GetServiceStatusResult>
+</GetServiceStatusResponse>"""
+
+
+@pytest.fixture
+def server():
+    """Local HTTP server replying with the status codes queued in `server.statuses`."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.server.hits += 1
+            time.sleep(self.server.delay)
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+            body = STATUS_RESPONSE if status == 200 else b"Request is throttled"
+            self.send_response(status)
+            self.send_header("Content-Type", "text/xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = HTTPServer(("127.0.0.1", 0), Handler)
+    httpd.hits = 0
+    httpd.statuses = []
+    httpd.delay = 0
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.01}
+    )
+    thread.daemon = True
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def api(server):
+    """MWS instance pointed at the local server, through its pooled adapter."""
+    api = MWS("a", "b", "c")
+    adapter = api.session.get_adapter("https://")
+    # No need to wait between retries in tests.
+    adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+    api.session.mount("http://", adapter)
+    api.domain = "http://127.0.0.1:{}".format(server.server_address[1])
+    yield api
+    api.close()
+
+
+def test_request_goes_through_session(api, server, monkeypatch):
+    calls = []
+    session_request = api.session.request
+
+    def recording_request(*args, **kwargs):
+        calls.append(args)
+        return session_request(*args, **kwargs)
+
+    monkeypatch.setattr(api.session, "request", recording_request)
+    response = api.get_service_status()
+    assert isinstance(response, DictWrapper)
+    assert response.parsed["Status"]["value"] == "GREEN"
+    assert len(calls) == 1
+
+
+def test_server_errors_are_retried(api, server):
+    server.statuses = [503, 503]
+    response = api.get_service_status()
+    assert response.parsed["Status"]["value"] == "GREEN"
+    assert server.hits == 3
+
+
+def test_server_error_raised_once_retries_run_out(api, server):
+    server.statuses = [503] * 10
+    with pytest.raises(MWSError) as exc_info:
+        api.get_service_status()
+    assert exc_info.value.response.status_code == 503
+    # The first attempt, plus three retries
+    assert server.hits == 4
+
+
+def test_read_timeout_is_not_retried(api, server):
+    server.delay = 0.5
+    with pytest.raises(ReadTimeout):
+        api.make_request({"Action": "GetServiceStatus"}, timeout=0.1)
+    assert server.hits == 1
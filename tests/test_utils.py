@@ -1,4 +1,11 @@
+import datetime
+from urllib.parse import quote
+
+from mws.mws import build_request_description
 from mws.mws import calc_request_description
+from mws.mws import clean_params
+from mws.mws import percent_encode
+from mws.mws import remove_namespace
 from mws.utils import calc_md5
 
 
@@ -29,3 +36,47 @@ def test_calc_request_description(access_key, account_id):
         "&Timestamp=2017-08-12T19%3A40%3A35Z"
         "&Version=2017-01-01"
     )
+
+
+def test_build_request_description_matches_clean_and_calc():
+    params = {
+        "Action": "ListOrders",
+        "CreatedAfter": datetime.datetime(2017, 8, 12, 19, 40, 35),
+        "IsPrime": False,
+        "Empty": "",
+        "Missing": None,
+        "SellerSKU": "SKU with spaces/slash",
+        "MaxResultsPerPage": 10,
+    }
+    request_description = build_request_description(params)
+    assert request_description == calc_request_description(clean_params(params))
+    assert request_description == (
+        "Action=ListOrders"
+        "&CreatedAfter=2017-08-12T19%3A40%3A35"
+        "&IsPrime=false"
+        "&MaxResultsPerPage=10"
+        "&SellerSKU=SKU%20with%20spaces%2Fslash"
+    )
+
+
+def test_remove_namespace():
+    xml = (
+        '<Response xmlns="http://mws.amazonservices.com/">'
+        '<Products xmlns:ns2="http://mws.amazonservices.com/default.xsd">'
+        '<ns2:Title xml:lang="en-US">Title</ns2:Title>'
+        "</Products></Response>"
+    )
+    assert remove_namespace(xml) == (
+        '<Response><Products><Title lang="en-US">Title</Title></Products></Response>'
+    )
+
+
+def test_percent_encode_matches_quote():
+    for value in (
+        "2017-08-12T19:40:35",
+        "SKU with spaces/slash+plus&amp",
+        "Ünïcode ☃",
+        "-_.~",
+        "",
+    ):
+        assert percent_encode(value) == quote(value, safe="-_.~")
@@ -1,3 +1,6 @@
+import io
+import zipfile
+
 import pytest
 from mws import MWSError
 from mws.mws import DataWrapper
@@ -730,3 +733,149 @@ def test_decode_byte_xml_x94():
     # Process and assert
     output = DictWrapper(stripped_original)
     assert output.parsed == expected
+
+
+def test_dictwrapper_strips_namespaces_while_parsing():
+    """Namespaced tags and attributes are reduced to their local names,
+    while text content that merely looks like a prefix is left untouched."""
+    original = b"""<?xml version="1.0"?>
+    <GetReportResponse xmlns="http://mws.amazonaws.com/doc/2009-01-01/">
+        <GetReportResult xmlns:ns2="http://mws.amazonaws.com/doc/2009-01-01/default.xsd">
+            <ns2:Note xml:lang="en-US">xml:space and ns2:prefix</ns2:Note>
+        </GetReportResult>
+    </GetReportResponse>
+    """
+    output = DictWrapper(original, "GetReportResult")
+    assert output.parsed["Note"] == {
+        "value": "xml:space and ns2:prefix",
+        "lang": {"value": "en-US"},
+    }
+
+
+class StreamedResponse(object):
+    """Stand-in for a `requests.Response` requested with `stream=True`."""
+
+    def __init__(self, content):
+        self.content = content
+
+    def iter_content(self, chunk_size):
+        for idx in range(0, len(self.content), chunk_size):
+            yield self.content[idx : idx + chunk_size]
+
+
+def test_content_md5_comparison_streamed():
+    data = b"abc\tdef"
+    wrapper = DataWrapper(None, {"content-md5": "Zj+Bh1BJ8HzBb9ToK28qFQ=="})
+    wrapper.response = StreamedResponse(data)
+    assert b"".join(wrapper.iter_content(chunk_size=2)) == data
+
+
+def test_content_md5_check_streamed_raises_exception_if_fails():
+    wrapper = DataWrapper(None, {"content-md5": "notthehash"})
+    wrapper.response = StreamedResponse(b"abc\tdef")
+    with pytest.raises(MWSError):
+        b"".join(wrapper.iter_content(chunk_size=2))
+
+
+def test_unzipped_reads_members_in_memory(tmp_path, monkeypatch):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr("report.txt", "sku\tqty\nabc\t1\n")
+    monkeypatch.chdir(tmp_path)
+
+    wrapper = DataWrapper(buffer.getvalue(), {"content-type": "application/zip"})
+    unzipped = wrapper.unzipped
+    assert unzipped.namelist() == ["report.txt"]
+    assert unzipped.read("report.txt") == b"sku\tqty\nabc\t1\n"
+    # Nothing extracted to the working directory
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dictwrapper_record_tag_yields_records():
+    """With a record tag, records are parsed one at a time from the response."""
+    original = (
+        b'<?xml version="1.0"?>'
+        b'<ListInventorySupplyResponse xmlns="http://mws.amazonaws.com/FulfillmentInventory/2010-10-01/">'
+        b"<ListInventorySupplyResult><InventorySupplyList>"
+        + b"".join(
+            b"<member><SellerSKU>SKU-%d</SellerSKU><InStockSupplyQuantity>%d</InStockSupplyQuantity></member>"
+            % (idx, idx)
+            for idx in range(3)
+        )
+        + b"</InventorySupplyList></ListInventorySupplyResult>"
+        b"</ListInventorySupplyResponse>"
+    )
+    output = DictWrapper(original, "ListInventorySupplyResult", record_tag="member")
+    records = list(output.parsed)
+    assert records == [
+        {
+            "SellerSKU": {"value": "SKU-%d" % idx},
+            "InStockSupplyQuantity": {"value": str(idx)},
+        }
+        for idx in range(3)
+    ]
+
+
+def test_dictwrapper_raw_builds_plain_dicts():
+    original = b"""<?xml version="1.0"?>
+    <GetServiceStatusResponse xmlns="https://mws.amazonservices.com/Orders/2013-09-01">
+        <GetServiceStatusResult><Status>GREEN</Status></GetServiceStatusResult>
+    </GetServiceStatusResponse>
+    """
+    output = DictWrapper(original, "GetServiceStatusResult", raw=True)
+    assert output.parsed == {"Status": {"value": "GREEN"}}
+    assert type(output.parsed) is dict
+    assert type(output.parsed["Status"]) is dict
+
+    output = DictWrapper(original, record_tag="Status", raw=True)
+    assert [type(record) for record in output.parsed] == [dict]
+
+
+def test_dictwrapper_keeps_other_namespaces():
+    """Only the default, "ns2" and "xml" namespaces are stripped, as `remove_namespace` does:
+    elements in any other namespace keep a "namespace" key."""
+    original = b"""<?xml version="1.0"?>
+    <GetReportResponse xmlns="http://mws.amazonaws.com/doc/2009-01-01/">
+        <GetReportResult xmlns:ns2="http://mws.amazonaws.com/doc/2009-01-01/default.xsd">
+            <ns2:Bar>b</ns2:Bar>
+            <x:Foo xmlns:x="urn:x">v</x:Foo>
+        </GetReportResult>
+    </GetReportResponse>
+    """
+    output = DictWrapper(original, "GetReportResult")
+    assert output.parsed["Bar"] == {"value": "b"}
+    assert output.parsed["Foo"] == {"value": "v", "namespace": "urn:x"}
+
+
+def test_streamed_datawrapper_requires_iter_content():
+    wrapper = DataWrapper(None, {"content-type": "application/zip"})
+    wrapper.response = StreamedResponse(b"")
+    with pytest.raises(MWSError, match="iter_content"):
+        wrapper.parsed
+    with pytest.raises(MWSError, match="iter_content"):
+        wrapper.unzipped
+
+
+def test_dictwrapper_record_tag_keeps_remainder():
+    """Pagination tokens outside the records are available once records are iterated."""
+    original = (
+        b'<?xml version="1.0"?>'
+        b'<GetReportRequestListResponse xmlns="http://mws.amazonaws.com/doc/2009-01-01/">'
+        b"<GetReportRequestListResult>"
+        b"<NextToken>2YgYW55IGNhcm5hbCBwbGVhcw==</NextToken>"
+        b"<HasNext>true</HasNext>"
+        b"<ReportRequestInfo><ReportRequestId>1</ReportRequestId></ReportRequestInfo>"
+        b"<ReportRequestInfo><ReportRequestId>2</ReportRequestId></ReportRequestInfo>"
+        b"</GetReportRequestListResult>"
+        b"</GetReportRequestListResponse>"
+    )
+    output = DictWrapper(
+        original, "GetReportRequestListResult", record_tag="ReportRequestInfo"
+    )
+    assert output.remainder is None
+    records = list(output.parsed)
+    assert [record["ReportRequestId"]["value"] for record in records] == ["1", "2"]
+    assert output.remainder == {
+        "NextToken": {"value": "2YgYW55IGNhcm5hbCBwbGVhcw=="},
+        "HasNext": {"value": "true"},
+    }